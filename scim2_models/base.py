@@ -4,6 +4,7 @@ from enum import auto
 from inspect import isclass
 from typing import Annotated
 from typing import Any
+from typing import ClassVar
 from typing import Generic
 from typing import Optional
 from typing import TypeVar
@@ -42,33 +43,35 @@ def validate_model_attribute(model: type["BaseModel"], attribute_base: str) -> N
     """Validate that an attribute name or a sub-attribute path exist for a given model."""
     from scim2_models.base import BaseModel
 
-    attribute_name, *sub_attribute_blocks = attribute_base.split(".")
-    sub_attribute_base = ".".join(sub_attribute_blocks)
-
-    aliases = {field.validation_alias for field in model.model_fields.values()}
-
-    if normalize_attribute_name(attribute_name) not in aliases:
-        raise ValueError(
-            f"Model '{model.__name__}' has no attribute named '{attribute_name}'"
+    attribute_name, *sub_attribute_names = attribute_base.split(".")
+    while True:
+        field_name = model._get_field_names_by_alias().get(
+            normalize_attribute_name(attribute_name)
         )
+        if field_name is None:
+            raise ValueError(
+                f"Model '{model.__name__}' has no attribute named '{attribute_name}'"
+            )
 
-    if sub_attribute_base:
-        attribute_type = model.get_field_root_type(attribute_name)
+        if not sub_attribute_names:
+            return
 
+        attribute_type = model.get_field_root_type(field_name)
         if not attribute_type or not issubclass(attribute_type, BaseModel):
+            sub_attribute_base = ".".join(sub_attribute_names)
             raise ValueError(
                 f"Attribute '{attribute_name}' is not a complex attribute, and cannot have a '{sub_attribute_base}' sub-attribute"
             )
 
-        validate_model_attribute(attribute_type, sub_attribute_base)
+        model = attribute_type
+        attribute_name, *sub_attribute_names = sub_attribute_names
 
 
 def extract_schema_and_attribute_base(attribute_urn: str) -> tuple[str, str]:
     # Extract the schema urn part and the attribute name part from attribute
     # name, as defined in :rfc:`RFC7644 §3.10 <7644#section-3.10>`.
 
-    *urn_blocks, attribute_base = attribute_urn.split(":")
-    schema = ":".join(urn_blocks)
+    schema, _, attribute_base = attribute_urn.rpartition(":")
     return schema, attribute_base
 
 
@@ -116,9 +119,9 @@ def validate_attribute_urn(
 
 
 def contains_attribute_or_subattributes(attribute_urns: list[str], attribute_urn: str):
+    prefixes = (f"{attribute_urn}.", f"{attribute_urn}:")
     return attribute_urn in attribute_urns or any(
-        item.startswith(f"{attribute_urn}.") or item.startswith(f"{attribute_urn}:")
-        for item in attribute_urns
+        item.startswith(prefixes) for item in attribute_urns
     )
 
 
@@ -150,13 +153,7 @@ class Reference(UserString, Generic[ReferenceTypes]):
         _source: type[Any],
         _handler: GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
-        return core_schema.no_info_after_validator_function(
-            cls._validate, core_schema.str_schema()
-        )
-
-    @classmethod
-    def _validate(cls, input_value: str, /) -> str:
-        return input_value
+        return core_schema.str_schema()
 
 
 class Context(Enum):
@@ -414,9 +411,51 @@ class BaseModel(PydanticBaseModel):
         extra="forbid",
     )
 
+    __scim_cache__: ClassVar[dict[Any, Any]]
+
+    @classmethod
+    def _get_class_cache(cls) -> dict[Any, Any]:
+        """Return a cache dict owned by the class itself.
+
+        The cache is stored in the class namespace so it is not shared
+        with subclasses, and is garbage collected along with the class.
+        """
+        if "__scim_cache__" not in cls.__dict__:
+            cls.__scim_cache__ = {}
+        return cls.__dict__["__scim_cache__"]
+
+    @classmethod
+    def _get_field_names_by_alias(cls) -> dict[str, str]:
+        """Map the normalized attribute names to the model field names."""
+        class_cache = cls._get_class_cache()
+        if "field_names_by_alias" not in class_cache:
+            class_cache["field_names_by_alias"] = {
+                field_info.validation_alias: field_name
+                for field_name, field_info in cls.model_fields.items()
+                if isinstance(field_info.validation_alias, str)
+            }
+        return class_cache["field_names_by_alias"]
+
+    @classmethod
+    def _get_complex_field_names(cls) -> tuple[str, ...]:
+        """Return the names of the fields holding complex attributes."""
+        class_cache = cls._get_class_cache()
+        if "complex_field_names" not in class_cache:
+            class_cache["complex_field_names"] = tuple(
+                field_name
+                for field_name in cls.model_fields
+                if is_complex_attribute(cls.get_field_root_type(field_name))
+            )
+        return class_cache["complex_field_names"]
+
     @classmethod
     def get_field_annotation(cls, field_name: str, annotation_type: type) -> Any:
         """Return the annotation of type 'annotation_type' of the field 'field_name'."""
+        class_cache = cls._get_class_cache()
+        cache_key = ("field_annotation", field_name, annotation_type)
+        if cache_key in class_cache:
+            return class_cache[cache_key]
+
         field_metadata = cls.model_fields[field_name].metadata
 
         default_value = getattr(annotation_type, "_default", None)
@@ -427,6 +466,7 @@ class BaseModel(PydanticBaseModel):
         field_annotation = next(
             filter(annotation_type_filter, field_metadata), default_value
         )
+        class_cache[cache_key] = field_annotation
         return field_annotation
 
     @classmethod
@@ -436,6 +476,11 @@ class BaseModel(PydanticBaseModel):
         For example, return 'GroupMember' for
         'Optional[List[GroupMember]]'
         """
+        class_cache = cls._get_class_cache()
+        cache_key = ("field_root_type", attribute_name)
+        if cache_key in class_cache:
+            return class_cache[cache_key]
+
         attribute_type = cls.model_fields[attribute_name].annotation
 
         # extract 'x' from 'Optional[x]'
@@ -447,11 +492,17 @@ class BaseModel(PydanticBaseModel):
         if origin and isclass(origin) and issubclass(origin, list):
             attribute_type = get_args(attribute_type)[0]
 
+        class_cache[cache_key] = attribute_type
         return attribute_type
 
     @classmethod
     def get_field_multiplicity(cls, attribute_name: str) -> bool:
         """Indicate whether a field holds multiple values."""
+        class_cache = cls._get_class_cache()
+        cache_key = ("field_multiplicity", attribute_name)
+        if cache_key in class_cache:
+            return class_cache[cache_key]
+
         attribute_type = cls.model_fields[attribute_name].annotation
 
         # extract 'x' from 'Optional[x]'
@@ -459,7 +510,9 @@ class BaseModel(PydanticBaseModel):
             attribute_type = get_args(attribute_type)[0]
 
         origin = get_origin(attribute_type)
-        return isinstance(origin, type) and issubclass(origin, list)
+        multiplicity = isinstance(origin, type) and issubclass(origin, list)
+        class_cache[cache_key] = multiplicity
+        return multiplicity
 
     @field_validator("*")
     @classmethod
@@ -488,14 +541,14 @@ class BaseModel(PydanticBaseModel):
 
         if (
             context in (Context.RESOURCE_QUERY_REQUEST, Context.SEARCH_REQUEST)
-            and mutability == Mutability.write_only
+            and mutability is Mutability.write_only
         ):
             raise exc
 
         if (
             context
             in (Context.RESOURCE_CREATION_REQUEST, Context.RESOURCE_REPLACEMENT_REQUEST)
-            and mutability == Mutability.read_only
+            and mutability is Mutability.read_only
         ):
             return None
 
@@ -542,7 +595,7 @@ class BaseModel(PydanticBaseModel):
         for field_name in cls.model_fields:
             returnability = cls.get_field_annotation(field_name, Returned)
 
-            if returnability == Returned.always and getattr(value, field_name) is None:
+            if returnability is Returned.always and getattr(value, field_name) is None:
                 raise PydanticCustomError(
                     "returned_error",
                     "Field '{field_name}' has returnability 'always' but value is missing or null",
@@ -552,7 +605,7 @@ class BaseModel(PydanticBaseModel):
                 )
 
             if (
-                returnability == Returned.never
+                returnability is Returned.never
                 and getattr(value, field_name) is not None
             ):
                 raise PydanticCustomError(
@@ -587,7 +640,7 @@ class BaseModel(PydanticBaseModel):
         for field_name in cls.model_fields:
             necessity = cls.get_field_annotation(field_name, Required)
 
-            if necessity == Required.true and getattr(value, field_name) is None:
+            if necessity is Required.true and getattr(value, field_name) is None:
                 raise PydanticCustomError(
                     "required_error",
                     "Field '{field_name}' is required but value is missing or null",
@@ -604,17 +657,16 @@ class BaseModel(PydanticBaseModel):
         cls, value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
     ) -> Self:
         """Check if 'immutable' attributes have been mutated in replacement requests."""
-        from scim2_models.rfc7643.resource import Resource
-
         value = handler(value)
 
         context = info.context.get("scim") if info.context else None
         original = info.context.get("original") if info.context else None
-        if (
-            context == Context.RESOURCE_REPLACEMENT_REQUEST
-            and issubclass(cls, Resource)
-            and original is not None
-        ):
+        if context is not Context.RESOURCE_REPLACEMENT_REQUEST or original is None:
+            return value
+
+        from scim2_models.rfc7643.resource import Resource
+
+        if issubclass(cls, Resource):
             cls.check_mutability_issues(original, value)
         return value
 
@@ -624,14 +676,18 @@ class BaseModel(PydanticBaseModel):
         model = replacement.__class__
         for field_name in model.model_fields:
             mutability = model.get_field_annotation(field_name, Mutability)
-            if mutability == Mutability.immutable and getattr(
-                original, field_name
-            ) != getattr(replacement, field_name):
-                raise PydanticCustomError(
-                    "mutability_error",
-                    "Field '{field_name}' is immutable but the request value is different than the original value.",
-                    {"field_name": field_name},
-                )
+            if mutability is Mutability.immutable:
+                original_value = getattr(original, field_name)
+                replacement_value = getattr(replacement, field_name)
+                if (
+                    original_value is not replacement_value
+                    and original_value != replacement_value
+                ):
+                    raise PydanticCustomError(
+                        "mutability_error",
+                        "Field '{field_name}' is immutable but the request value is different than the original value.",
+                        {"field_name": field_name},
+                    )
 
             attr_type = model.get_field_root_type(field_name)
             if is_complex_attribute(attr_type) and not model.get_field_multiplicity(
@@ -649,18 +705,15 @@ class BaseModel(PydanticBaseModel):
         """
         from scim2_models.rfc7643.resource import Resource
 
-        for field_name in self.model_fields:
-            attr_type = self.get_field_root_type(field_name)
-            if not is_complex_attribute(attr_type):
-                continue
-
+        for field_name in self._get_complex_field_names():
             main_schema = (
                 getattr(self, "_schema", None)
                 or self.model_fields["schemas"].default[0]
             )
 
             separator = ":" if isinstance(self, Resource) else "."
-            schema = f"{main_schema}{separator}{field_name}"
+            alias = self.model_fields[field_name].serialization_alias or field_name
+            schema = f"{main_schema}{separator}{alias}"
 
             if attr_value := getattr(self, field_name):
                 if isinstance(attr_value, list):
@@ -696,7 +749,7 @@ class BaseModel(PydanticBaseModel):
         if (
             scim_ctx
             in (Context.RESOURCE_CREATION_REQUEST, Context.RESOURCE_REPLACEMENT_REQUEST)
-            and mutability == Mutability.read_only
+            and mutability is Mutability.read_only
         ):
             return None
 
@@ -706,7 +759,7 @@ class BaseModel(PydanticBaseModel):
                 Context.RESOURCE_QUERY_REQUEST,
                 Context.SEARCH_REQUEST,
             )
-            and mutability == Mutability.write_only
+            and mutability is Mutability.write_only
         ):
             return None
 
@@ -722,13 +775,11 @@ class BaseModel(PydanticBaseModel):
         )
 
         attribute_urn = normalize_attribute_name(attribute_urn)
-        included_urns = [normalize_attribute_name(urn) for urn in included_urns]
-        excluded_urns = [normalize_attribute_name(urn) for urn in excluded_urns]
 
-        if returnability == Returned.never:
+        if returnability is Returned.never:
             return None
 
-        if returnability == Returned.default and (
+        if returnability is Returned.default and (
             (
                 included_urns
                 and not contains_attribute_or_subattributes(
@@ -739,7 +790,7 @@ class BaseModel(PydanticBaseModel):
         ):
             return None
 
-        if returnability == Returned.request and attribute_urn not in included_urns:
+        if returnability is Returned.request and attribute_urn not in included_urns:
             return None
 
         return value
@@ -772,7 +823,7 @@ class BaseModel(PydanticBaseModel):
         context.setdefault("scim", scim_ctx)
         context.setdefault("original", original)
 
-        if scim_ctx == Context.RESOURCE_REPLACEMENT_REQUEST and original is None:
+        if scim_ctx is Context.RESOURCE_REPLACEMENT_REQUEST and original is None:
             raise ValueError(
                 "Resource queries replacement validation must compare to an original resource"
             )
@@ -788,11 +839,11 @@ class BaseModel(PydanticBaseModel):
     ):
         kwargs.setdefault("context", {}).setdefault("scim", scim_ctx)
         kwargs["context"]["scim_attributes"] = [
-            validate_attribute_urn(attribute, self.__class__)
+            normalize_attribute_name(validate_attribute_urn(attribute, self.__class__))
             for attribute in (attributes or [])
         ]
         kwargs["context"]["scim_excluded_attributes"] = [
-            validate_attribute_urn(attribute, self.__class__)
+            normalize_attribute_name(validate_attribute_urn(attribute, self.__class__))
             for attribute in (excluded_attributes or [])
         ]
 
@@ -847,12 +898,26 @@ class BaseModel(PydanticBaseModel):
 
         See :rfc:`RFC7644 §3.10 <7644#section-3.10>`.
         """
-        main_schema = self.model_fields["schemas"].default[0]
-        alias = self.model_fields[field_name].serialization_alias or field_name
+        return self._get_attribute_urns()[field_name]
 
-        # if alias contains a ':' this is an extension urn
-        full_urn = alias if ":" in alias else f"{main_schema}:{alias}"
-        return full_urn
+    @classmethod
+    def _get_attribute_urns(cls) -> dict[str, str]:
+        """Map the field names to the full URN of their attributes."""
+        class_cache = cls._get_class_cache()
+        if "attribute_urns" in class_cache:
+            return class_cache["attribute_urns"]
+
+        main_schema = cls.model_fields["schemas"].default[0]
+        attribute_urns = {}
+        for field_name, field_info in cls.model_fields.items():
+            alias = field_info.serialization_alias or field_name
+
+            # if alias contains a ':' this is an extension urn
+            attribute_urns[field_name] = (
+                alias if ":" in alias else f"{main_schema}:{alias}"
+            )
+        class_cache["attribute_urns"] = attribute_urns
+        return attribute_urns
 
 
 class ComplexAttribute(BaseModel):
@@ -11,6 +11,7 @@ from typing import get_origin
 from pydantic import Field
 from pydantic import WrapSerializer
 from pydantic import field_serializer
+from pydantic import field_validator
 
 from ..base import BaseModel
 from ..base import BaseModelType
@@ -179,6 +180,14 @@ class Resource(BaseModel, Generic[AnyExtension], metaclass=ResourceMetaclass):
     @classmethod
     def get_extension_models(cls) -> dict[str, type[Extension]]:
         """Return extension a dict associating extension models with their schemas."""
+        return dict(cls._get_extension_models())
+
+    @classmethod
+    def _get_extension_models(cls) -> dict[str, type[Extension]]:
+        class_cache = cls._get_class_cache()
+        if "extension_models" in class_cache:
+            return class_cache["extension_models"]
+
         extension_models = cls.__pydantic_generic_metadata__.get("args", [])
         extension_models = (
             get_args(extension_models[0])
@@ -189,15 +198,25 @@ class Resource(BaseModel, Generic[AnyExtension], metaclass=ResourceMetaclass):
         by_schema = {
             ext.model_fields["schemas"].default[0]: ext for ext in extension_models
         }
+        class_cache["extension_models"] = by_schema
         return by_schema
 
     @classmethod
     def get_extension_model(cls, name_or_schema) -> Optional[type[Extension]]:
         """Return an extension by its name or schema."""
-        for schema, extension in cls.get_extension_models().items():
-            if schema == name_or_schema or extension.__name__ == name_or_schema:
-                return extension
-        return None
+        return cls._get_extension_models_by_name_or_schema().get(name_or_schema)
+
+    @classmethod
+    def _get_extension_models_by_name_or_schema(cls) -> dict[str, type[Extension]]:
+        class_cache = cls._get_class_cache()
+        if "extension_models_by_name_or_schema" not in class_cache:
+            extension_models = cls._get_extension_models()
+            by_name = {ext.__name__: ext for ext in extension_models.values()}
+            class_cache["extension_models_by_name_or_schema"] = {
+                **by_name,
+                **extension_models,
+            }
+        return class_cache["extension_models_by_name_or_schema"]
 
     @staticmethod
     def get_by_schema(
@@ -213,7 +232,7 @@ class Resource(BaseModel, Generic[AnyExtension], metaclass=ResourceMetaclass):
                 by_schema.update(
                     {
                         schema.lower(): extension
-                        for schema, extension in resource_type.get_extension_models().items()
+                        for schema, extension in resource_type._get_extension_models().items()
                     }
                 )
 
@@ -228,12 +247,19 @@ class Resource(BaseModel, Generic[AnyExtension], metaclass=ResourceMetaclass):
         schema = payload["schemas"][0]
         return Resource.get_by_schema(resource_types, schema, **kwargs)
 
+    @field_validator("schemas")
+    @classmethod
+    def deduplicate_schemas(cls, schemas: list[str]) -> list[str]:
+        """Remove duplicate schema URNs while preserving their order."""
+        return list(dict.fromkeys(schemas))
+
     @field_serializer("schemas")
     def set_extension_schemas(self, schemas: Annotated[list[str], Required.true]):
         """Add model extension ids to the 'schemas' attribute."""
-        extension_schemas = self.get_extension_models().keys()
+        extension_schemas = self._get_extension_models().keys()
+        known_schemas = set(self.schemas)
         schemas = self.schemas + [
-            schema for schema in extension_schemas if schema not in self.schemas
+            schema for schema in extension_schemas if schema not in known_schemas
         ]
         return schemas
 
@@ -280,6 +306,14 @@ def dedicated_attributes(model):
 
 
 def model_to_schema(model: type[BaseModel]):
+    # Schemas are mutable, so each caller gets its own copy of the cached one.
+    class_cache = model._get_class_cache()
+    if "schema" not in class_cache:
+        class_cache["schema"] = _model_to_schema(model)
+    return class_cache["schema"].model_copy(deep=True)
+
+
+def _model_to_schema(model: type[BaseModel]):
     from scim2_models.rfc7643.schema import Schema
 
     schema_urn = model.model_fields["schemas"].default[0]
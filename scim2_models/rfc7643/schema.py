@@ -34,10 +34,12 @@ from ..utils import normalize_attribute_name
 from .resource import Extension
 from .resource import Resource
 
+NON_IDENTIFIER_REGEX = re.compile(r"\W|^(?=\d)")
+
 
 def make_python_identifier(identifier: str) -> str:
     """Sanitize string to be a suitable Python/Pydantic class attribute name."""
-    sanitized = re.sub(r"\W|^(?=\d)", "", identifier)
+    sanitized = NON_IDENTIFIER_REGEX.sub("", identifier)
     if sanitized in RESERVED_WORDS:
         sanitized = f"{sanitized}_"
 
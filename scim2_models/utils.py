@@ -1,5 +1,6 @@
 import base64
 import re
+from functools import lru_cache
 from typing import Annotated
 from typing import Literal
 from typing import Optional
@@ -74,6 +75,14 @@ class Base64Encoder(EncoderProtocol):  # pragma: no cover
 Base64Bytes = Annotated[bytes, EncodedBytes(encoder=Base64Encoder)]
 
 
+SNAKE_CASE_WORD_REGEX = re.compile(r"_+([0-9A-Za-z]+)")
+
+
+def _title_snake_case_word(match: re.Match) -> str:
+    return match.group(1).title()
+
+
+@lru_cache(maxsize=1024)
 def to_camel(string: str) -> str:
     """Transform strings to camelCase.
 
@@ -83,17 +92,24 @@ def to_camel(string: str) -> str:
     '$ref' stays '$ref'.
     """
     snake = to_snake(string)
-    camel = re.sub(r"_+([0-9A-Za-z]+)", lambda m: m.group(1).title(), snake)
+    camel = SNAKE_CASE_WORD_REGEX.sub(_title_snake_case_word, snake)
     return camel
 
 
+ATTRIBUTE_NAME_SEPARATOR_REGEX = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=1024)
 def normalize_attribute_name(attribute_name: str) -> str:
     """Remove all non-alphabetical characters and lowerise a string.
 
     This method is used for attribute name validation.
     """
+    if attribute_name.isalnum():
+        return attribute_name.lower()
+
     is_extension_attribute = ":" in attribute_name
     if not is_extension_attribute:
-        attribute_name = re.sub(r"[\W_]+", "", attribute_name)
+        attribute_name = ATTRIBUTE_NAME_SEPARATOR_REGEX.sub("", attribute_name)
 
     return attribute_name.lower()
@@ -1,9 +1,12 @@
 import datetime
+import gc
+import weakref
 from typing import Literal
 from typing import Union
 
 from scim2_models.base import CaseExact
 from scim2_models.base import ComplexAttribute
+from scim2_models.base import Context
 from scim2_models.base import ExternalReference
 from scim2_models.base import MultiValuedComplexAttribute
 from scim2_models.base import Mutability
@@ -16,6 +19,7 @@ from scim2_models.rfc7643.resource import Extension
 from scim2_models.rfc7643.resource import Resource
 from scim2_models.rfc7643.schema import Attribute
 from scim2_models.rfc7643.schema import Schema
+from scim2_models.rfc7643.user import User
 from scim2_models.utils import Base64Bytes
 
 
@@ -2781,3 +2785,24 @@ def test_make_schema_model_from_schema(load_sample):
 def test_empty_attribute():
     """Attributes must at least have a name to be pythonizable."""
     assert Attribute().to_python() is None
+
+
+def test_dynamic_models_are_garbage_collected():
+    """Per-class caches must not keep dynamically built models alive."""
+
+    def make_model():
+        model = Resource.from_schema(User.to_schema())
+        obj = model.model_validate(
+            {"userName": "foobar", "phoneNumbers": [{"value": "555-555-5555"}]}
+        )
+        obj.model_dump(
+            scim_ctx=Context.RESOURCE_QUERY_RESPONSE,
+            attributes=["userName", "phoneNumbers.value"],
+        )
+        model.to_schema()
+        model.get_extension_model("EnterpriseUser")
+        return weakref.ref(model)
+
+    model_ref = make_model()
+    gc.collect()
+    assert model_ref() is None
@@ -106,6 +106,11 @@ def test_validate_attribute_urn():
         == "urn:example:2.0:Foo:snakeCase"
     )
 
+    assert (
+        validate_attribute_urn("phoneNumbers.value", User)
+        == "urn:ietf:params:scim:schemas:core:2.0:User:phoneNumbers.value"
+    )
+
     assert (
         validate_attribute_urn("urn:example:2.0:MyExtension:baz", Foo[MyExtension])
         == "urn:example:2.0:MyExtension:baz"
@@ -279,6 +284,36 @@ def test_attribute_inclusion_schema_extensions():
     )
 
 
+def test_sub_attribute_inclusion_camel_case():
+    """Test that sub-attributes of camelCase complex attributes can be included or excluded."""
+    user = User.model_validate(
+        {
+            "userName": "foobar",
+            "phoneNumbers": [{"value": "555-555-5555", "type": "work"}],
+        }
+    )
+
+    assert user.model_dump(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["phoneNumbers.value"]
+    ) == {
+        "schemas": [
+            "urn:ietf:params:scim:schemas:core:2.0:User",
+        ],
+        "phoneNumbers": [{"value": "555-555-5555"}],
+    }
+
+    assert user.model_dump(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE,
+        excluded_attributes=["phoneNumbers.value"],
+    ) == {
+        "schemas": [
+            "urn:ietf:params:scim:schemas:core:2.0:User",
+        ],
+        "userName": "foobar",
+        "phoneNumbers": [{"type": "work"}],
+    }
+
+
 def test_dump_after_assignment():
     """Test that attribute assignment does not break model dump."""
     user = User(id="1", user_name="ABC")
@@ -251,6 +251,28 @@ def test_extensions_schemas():
     }
 
 
+def test_duplicate_schemas():
+    """Verifies that duplicate schemas are only dumped once."""
+    user = User[EnterpriseUser].model_validate(
+        {
+            "schemas": [
+                "urn:ietf:params:scim:schemas:core:2.0:User",
+                "urn:ietf:params:scim:schemas:core:2.0:User",
+                "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User",
+            ],
+            "userName": "foobar",
+        }
+    )
+    assert user.schemas == [
+        "urn:ietf:params:scim:schemas:core:2.0:User",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User",
+    ]
+    assert user.model_dump()["schemas"] == [
+        "urn:ietf:params:scim:schemas:core:2.0:User",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User",
+    ]
+
+
 def test_validate_items_without_extension():
     """A model with an optional extension should be able to validate a payload without an extension payload.
 
@@ -274,23 +296,23 @@ def test_validate_items_without_extension():
 
 
 def test_get_extension_model():
-    assert User[EnterpriseUser].get_extension_model("EnterpriseUser") == EnterpriseUser
+    assert User[EnterpriseUser].get_extension_model("EnterpriseUser") is EnterpriseUser
     assert (
         User[EnterpriseUser].get_extension_model(
             "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
         )
-        == EnterpriseUser
+        is EnterpriseUser
     )
 
     assert (
         User[Union[EnterpriseUser, SuperHero]].get_extension_model("EnterpriseUser")
-        == EnterpriseUser
+        is EnterpriseUser
     )
     assert (
         User[Union[EnterpriseUser, SuperHero]].get_extension_model(
             "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
         )
-        == EnterpriseUser
+        is EnterpriseUser
     )
 
     assert User[SuperHero].get_extension_model("EnterpriseUser") is None
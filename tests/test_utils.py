@@ -1,15 +1,22 @@
+import pytest
+
 from scim2_models.utils import to_camel
 
 
-def test_to_camel():
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("foo", "foo"),
+        ("Foo", "foo"),
+        ("fooBar", "fooBar"),
+        ("FooBar", "fooBar"),
+        ("foo_bar", "fooBar"),
+        ("Foo_bar", "fooBar"),
+        ("foo_Bar", "fooBar"),
+        ("Foo_Bar", "fooBar"),
+        ("$foo$", "$foo$"),
+    ],
+)
+def test_to_camel(string, expected):
     """Test camilization utility."""
-    assert to_camel("foo") == "foo"
-    assert to_camel("Foo") == "foo"
-    assert to_camel("fooBar") == "fooBar"
-    assert to_camel("FooBar") == "fooBar"
-    assert to_camel("foo_bar") == "fooBar"
-    assert to_camel("Foo_bar") == "fooBar"
-    assert to_camel("foo_Bar") == "fooBar"
-    assert to_camel("Foo_Bar") == "fooBar"
-
-    assert to_camel("$foo$") == "$foo$"
+    assert to_camel(string) == expected